@@ -1,14 +1,20 @@
-import base64
-import json
 from typing import Dict, Any
 
 from mcp import McpError
 from mcp.server.fastmcp import Context
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from src.exceptions import ImageError
 from src.utils.bedrock import generate_image
+from src.utils.image import encode_image_file
 from src.utils.image_storage import save_image
 
+# Pre-serialized request body; only the variable fields are spliced in
+BODY_TEMPLATE = (
+    b'{"taskType":"BACKGROUND_REMOVAL",'
+    b'"backgroundRemovalParams":{"image":"%s"}}'
+)
+
 
 async def background_removal(
         image_path: str,
@@ -28,21 +34,15 @@ async def background_removal(
     """
     try:
         # Read image file and encode to base64
-        with open(image_path, "rb") as image_file:
-            input_image = base64.b64encode(image_file.read()).decode('utf8')
+        input_image = await encode_image_file(image_path)
 
-        body = json.dumps({
-            "taskType": "BACKGROUND_REMOVAL",
-            "backgroundRemovalParams": {
-                "image": input_image,
-            }
-        })
+        body = BODY_TEMPLATE % input_image
 
         # Generate image
-        image_bytes = generate_image(body)
+        image_bytes = await generate_image(body)
 
         # Save image
-        image_info = save_image(image_bytes, output_path=output_path)
+        image_info = save_image(image_bytes, prefix="background_removal", output_path=output_path)
 
         # Generate result
         result = {
@@ -53,6 +53,9 @@ async def background_removal(
         return result
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while removing background: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while removing background: {str(e)}"
+        ))
@@ -1,13 +1,27 @@
-import base64
-import json
+import re
 from typing import Dict, Any, List, Optional
 
+import orjson
 from mcp import McpError
 from mcp.server.fastmcp import Context
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from src.exceptions import ImageError
 from src.utils.bedrock import generate_image
+from src.utils.image import encode_image_file
 from src.utils.image_storage import save_image
+from src.utils.validation import validate_image_config
+
+# Hex color code in the format '#rrggbb'
+HEX_COLOR_PATTERN = re.compile(r"#[0-9a-fA-F]{6}")
+
+# Pre-serialized request body; only the variable fields are spliced in
+BODY_TEMPLATE = (
+    b'{"taskType":"COLOR_GUIDED_GENERATION",'
+    b'"colorGuidedGenerationParams":{"text":%s,"negativeText":%s,"colors":%s%s},'
+    b'"imageGenerationConfig":{"numberOfImages":1,"height":%d,"width":%d,"cfgScale":%s}}'
+)
+REFERENCE_IMAGE_TEMPLATE = b',"referenceImage":"%s"'
 
 
 async def color_guided_generation(
@@ -29,9 +43,9 @@ async def color_guided_generation(
         colors: List of color codes (1-10 hex color codes, e.g., "#ff8080")
         reference_image_path: File path of the reference image (optional)
         negative_prompt: Text specifying attributes to exclude from generation
-        height: Output image height (pixels)
-        width: Output image width (pixels)
-        cfg_scale: Prompt matching degree (1-20)
+        height: Output image height (320-4096 pixels, multiple of 16)
+        width: Output image width (320-4096 pixels, multiple of 16)
+        cfg_scale: Prompt matching degree (1.1-10)
         output_path: Absolute path to save the image
         ctx: MCP context
         
@@ -39,43 +53,38 @@ async def color_guided_generation(
         Dict: Dictionary containing the file path of the generated image
     """
     try:
+        # Validate image generation settings
+        validate_image_config(height, width, cfg_scale)
+
         # Validate color list
         if len(colors) < 1 or len(colors) > 10:
             raise ImageError("colors list must contain 1-10 color codes.")
 
         # Validate color codes
         for color in colors:
-            if not color.startswith("#") or len(color) != 7:
+            if not HEX_COLOR_PATTERN.fullmatch(color):
                 raise ImageError(f"Invalid color code: {color}. Hex color codes must be in the format '#rrggbb'.")
 
-        params = {
-            "text": prompt,
-            "negativeText": negative_prompt,
-            "colors": colors
-        }
-
         # If reference image exists, add it
+        reference_image = b""
         if reference_image_path:
-            with open(reference_image_path, "rb") as image_file:
-                input_image = base64.b64encode(image_file.read()).decode('utf8')
-                params["referenceImage"] = input_image
+            reference_image = REFERENCE_IMAGE_TEMPLATE % await encode_image_file(reference_image_path)
 
-        body = json.dumps({
-            "taskType": "COLOR_GUIDED_GENERATION",
-            "colorGuidedGenerationParams": params,
-            "imageGenerationConfig": {
-                "numberOfImages": 1,
-                "height": height,
-                "width": width,
-                "cfgScale": cfg_scale
-            }
-        })
+        body = BODY_TEMPLATE % (
+            orjson.dumps(prompt),
+            orjson.dumps(negative_prompt),
+            orjson.dumps(colors),
+            reference_image,
+            height,
+            width,
+            orjson.dumps(cfg_scale),
+        )
 
         # Generate image
-        image_bytes = generate_image(body)
+        image_bytes = await generate_image(body)
 
         # Save image
-        image_info = save_image(image_bytes, output_path=output_path)
+        image_info = save_image(image_bytes, prefix="color_guided_generation", output_path=output_path)
 
         # Generate result
         result = {
@@ -86,6 +95,9 @@ async def color_guided_generation(
         return result
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while generating image using color palette: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while generating image using color palette: {str(e)}"
+        ))
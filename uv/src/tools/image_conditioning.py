@@ -1,12 +1,21 @@
-import base64
-import json
 from typing import Dict, Any
 
+import orjson
 from mcp import McpError
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from src.exceptions import ImageError
 from src.utils.bedrock import generate_image
+from src.utils.image import encode_image_file
 from src.utils.image_storage import save_image
+from src.utils.validation import validate_image_config
+
+# Pre-serialized request body; only the variable fields are spliced in
+BODY_TEMPLATE = (
+    b'{"taskType":"TEXT_IMAGE",'
+    b'"textToImageParams":{"text":%s,"negativeText":%s,"conditionImage":"%s","controlMode":%s},'
+    b'"imageGenerationConfig":{"numberOfImages":1,"height":%d,"width":%d,"cfgScale":%s}}'
+)
 
 
 async def image_conditioning(
@@ -26,41 +35,41 @@ async def image_conditioning(
         image_path: File path of the reference image
         prompt: Text describing the image to be generated
         negative_prompt: Text specifying attributes to exclude from generation
-        control_mode: Control mode (CANNY_EDGE, etc.)
-        height: Output image height (pixels)
-        width: Output image width (pixels)
-        cfg_scale: Prompt matching degree (1-20)
+        control_mode: Control mode (CANNY_EDGE or SEGMENTATION)
+        height: Output image height (320-4096 pixels, multiple of 16)
+        width: Output image width (320-4096 pixels, multiple of 16)
+        cfg_scale: Prompt matching degree (1.1-10)
         output_path: Absolute path to save the image
         
     Returns:
         Dict: Dictionary containing the file path of the generated image
     """
     try:
+        # Validate image generation settings
+        validate_image_config(height, width, cfg_scale)
+
+        # Validate control mode
+        if control_mode not in ["CANNY_EDGE", "SEGMENTATION"]:
+            raise ImageError("control_mode must be 'CANNY_EDGE' or 'SEGMENTATION'.")
+
         # Read image file and encode to base64
-        with open(image_path, "rb") as image_file:
-            input_image = base64.b64encode(image_file.read()).decode('utf8')
+        input_image = await encode_image_file(image_path)
 
-        body = json.dumps({
-            "taskType": "TEXT_IMAGE",
-            "textToImageParams": {
-                "text": prompt,
-                "negativeText": negative_prompt,
-                "conditionImage": input_image,
-                "controlMode": control_mode
-            },
-            "imageGenerationConfig": {
-                "numberOfImages": 1,
-                "height": height,
-                "width": width,
-                "cfgScale": cfg_scale
-            }
-        })
+        body = BODY_TEMPLATE % (
+            orjson.dumps(prompt),
+            orjson.dumps(negative_prompt),
+            input_image,
+            orjson.dumps(control_mode),
+            height,
+            width,
+            orjson.dumps(cfg_scale),
+        )
 
         # Generate image
-        image_bytes = generate_image(body)
+        image_bytes = await generate_image(body)
 
         # Save image
-        image_info = save_image(image_bytes, output_path=output_path)
+        image_info = save_image(image_bytes, prefix="image_conditioning", output_path=output_path)
 
         # Generate result
         result = {
@@ -71,6 +80,9 @@ async def image_conditioning(
         return result
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while image conditioning: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while image conditioning: {str(e)}"
+        ))
@@ -1,12 +1,22 @@
-import base64
-import json
+import asyncio
 from typing import Dict, Any, List
 
+import orjson
 from mcp import McpError
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from src.exceptions import ImageError
 from src.utils.bedrock import generate_image
+from src.utils.image import encode_image_file
 from src.utils.image_storage import save_image
+from src.utils.validation import validate_image_config
+
+# Pre-serialized request body; only the variable fields are spliced in
+BODY_TEMPLATE = (
+    b'{"taskType":"IMAGE_VARIATION",'
+    b'"imageVariationParams":{"text":%s,"negativeText":%s,"images":["%s"],"similarityStrength":%s},'
+    b'"imageGenerationConfig":{"numberOfImages":1,"height":%d,"width":%d,"cfgScale":%s}}'
+)
 
 
 async def image_variation(
@@ -27,49 +37,43 @@ async def image_variation(
         prompt: Text for generating a variation image (optional)
         negative_prompt: Text specifying attributes to exclude from generation
         similarity_strength: Similarity between the original image and the generated image (0.2-1.0)
-        height: Output image height (pixels)
-        width: Output image width (pixels)
-        cfg_scale: Prompt matching degree (1-20)
+        height: Output image height (320-4096 pixels, multiple of 16)
+        width: Output image width (320-4096 pixels, multiple of 16)
+        cfg_scale: Prompt matching degree (1.1-10)
         output_path: Absolute path to save the image
         
     Returns:
         Dict: Dictionary containing the file path of the variation image
     """
     try:
+        # Validate image generation settings
+        validate_image_config(height, width, cfg_scale)
+
         # Validate image paths
         if len(image_paths) < 1 or len(image_paths) > 5:
             raise ImageError("image_paths list must contain 1-5 images.")
 
-        if similarity_strength < 0.2 or similarity_strength > 1.0:
+        if not 0.2 <= similarity_strength <= 1.0:
             raise ImageError("similarity_strength must be between 0.2 and 1.0.")
 
         # Read image files and encode to base64
-        encoded_images = []
-        for img_path in image_paths:
-            with open(img_path, "rb") as image_file:
-                encoded_images.append(base64.b64encode(image_file.read()).decode('utf8'))
+        encoded_images = await asyncio.gather(*(encode_image_file(img_path) for img_path in image_paths))
 
-        body = json.dumps({
-            "taskType": "IMAGE_VARIATION",
-            "imageVariationParams": {
-                "text": prompt,
-                "negativeText": negative_prompt,
-                "images": encoded_images,
-                "similarityStrength": similarity_strength,
-            },
-            "imageGenerationConfig": {
-                "numberOfImages": 1,
-                "height": height,
-                "width": width,
-                "cfgScale": cfg_scale
-            }
-        })
+        body = BODY_TEMPLATE % (
+            orjson.dumps(prompt),
+            orjson.dumps(negative_prompt),
+            b'","'.join(encoded_images),
+            orjson.dumps(similarity_strength),
+            height,
+            width,
+            orjson.dumps(cfg_scale),
+        )
 
         # Generate image
-        image_bytes = generate_image(body)
+        image_bytes = await generate_image(body)
 
         # Save image
-        image_info = save_image(image_bytes, output_path=output_path)
+        image_info = save_image(image_bytes, prefix="image_variation", output_path=output_path)
 
         # Generate result
         result = {
@@ -80,6 +84,9 @@ async def image_variation(
         return result
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while image variation: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while image variation: {str(e)}"
+        ))
@@ -1,12 +1,21 @@
-import base64
-import json
 from typing import Dict, Any
 
+import orjson
 from mcp import McpError
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from src.exceptions import ImageError
 from src.utils.bedrock import generate_image
+from src.utils.image import encode_image_file
 from src.utils.image_storage import save_image
+from src.utils.validation import validate_image_config
+
+# Pre-serialized request body; only the variable fields are spliced in
+BODY_TEMPLATE = (
+    b'{"taskType":"INPAINTING",'
+    b'"inPaintingParams":{"text":%s,"negativeText":%s,"image":"%s","maskPrompt":%s},'
+    b'"imageGenerationConfig":{"numberOfImages":1,"height":%d,"width":%d,"cfgScale":%s}}'
+)
 
 
 async def inpainting(
@@ -28,9 +37,9 @@ async def inpainting(
         prompt: Text prompt for the area to be inpainted
         mask_prompt: Text prompt for specifying the area to be masked (e.g., "window", "car")
         negative_prompt: Text prompt for excluding attributes from generation
-        height: Output image height (pixels)
-        width: Output image width (pixels)
-        cfg_scale: Image matching degree for the prompt (1-20)
+        height: Output image height (320-4096 pixels, multiple of 16)
+        width: Output image width (320-4096 pixels, multiple of 16)
+        cfg_scale: Image matching degree for the prompt (1.1-10)
         open_browser: Whether to open the image in the browser after generation
         output_path: Absolute path to save the image
         
@@ -38,31 +47,27 @@ async def inpainting(
         Dict: Dictionary containing the file path of the inpainted image
     """
     try:
+        # Validate image generation settings
+        validate_image_config(height, width, cfg_scale)
+
         # Read image file and encode to base64
-        with open(image_path, "rb") as image_file:
-            input_image = base64.b64encode(image_file.read()).decode('utf8')
+        input_image = await encode_image_file(image_path)
 
-        body = json.dumps({
-            "taskType": "INPAINTING",
-            "inPaintingParams": {
-                "text": prompt,
-                "negativeText": negative_prompt,
-                "image": input_image,
-                "maskPrompt": mask_prompt
-            },
-            "imageGenerationConfig": {
-                "numberOfImages": 1,
-                "height": height,
-                "width": width,
-                "cfgScale": cfg_scale
-            }
-        })
+        body = BODY_TEMPLATE % (
+            orjson.dumps(prompt),
+            orjson.dumps(negative_prompt),
+            input_image,
+            orjson.dumps(mask_prompt),
+            height,
+            width,
+            orjson.dumps(cfg_scale),
+        )
 
         # Generate image
-        image_bytes = generate_image(body)
+        image_bytes = await generate_image(body)
 
         # Save image
-        image_info = save_image(image_bytes, open_browser=open_browser, output_path=output_path)
+        image_info = save_image(image_bytes, prefix="inpainting", open_browser=open_browser, output_path=output_path)
 
         # Generate result
         result = {
@@ -73,6 +78,9 @@ async def inpainting(
         return result
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while inpainting: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while inpainting: {str(e)}"
+        ))
@@ -1,12 +1,22 @@
-import base64
-import json
+import asyncio
 from typing import Dict, Any
 
+import orjson
 from mcp import McpError
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from src.exceptions import ImageError
 from src.utils.bedrock import generate_image
+from src.utils.image import encode_image_file
 from src.utils.image_storage import save_image
+from src.utils.validation import validate_image_config
+
+# Pre-serialized request body; only the variable fields are spliced in
+BODY_TEMPLATE = (
+    b'{"taskType":"OUTPAINTING",'
+    b'"outPaintingParams":{"text":%s,"negativeText":%s,"image":"%s","maskImage":"%s","outPaintingMode":%s},'
+    b'"imageGenerationConfig":{"numberOfImages":1,"height":%d,"width":%d,"cfgScale":%s}}'
+)
 
 
 async def outpainting(
@@ -29,48 +39,44 @@ async def outpainting(
         prompt: Text describing the content to be generated in the outpainting area
         negative_prompt: Text specifying attributes to exclude from generation
         outpainting_mode: Outpainting mode (DEFAULT or PRECISE)
-        height: Output image height (pixels)
-        width: Output image width (pixels)
-        cfg_scale: Prompt matching degree (1-20)
+        height: Output image height (320-4096 pixels, multiple of 16)
+        width: Output image width (320-4096 pixels, multiple of 16)
+        cfg_scale: Prompt matching degree (1.1-10)
         output_path: Absolute path to save the image
         
     Returns:
         Dict: Dictionary containing the file path of the outpainted image
     """
     try:
+        # Validate image generation settings
+        validate_image_config(height, width, cfg_scale)
+
         # Validate outpainting mode
         if outpainting_mode not in ["DEFAULT", "PRECISE"]:
             raise ImageError("outpainting_mode must be 'DEFAULT' or 'PRECISE'.")
 
-        # Read image file and encode to base64
-        with open(image_path, "rb") as image_file:
-            input_image = base64.b64encode(image_file.read()).decode('utf8')
-
-        with open(mask_image_path, "rb") as mask_file:
-            input_mask_image = base64.b64encode(mask_file.read()).decode('utf8')
+        # Read image files and encode to base64
+        input_image, input_mask_image = await asyncio.gather(
+            encode_image_file(image_path),
+            encode_image_file(mask_image_path)
+        )
 
-        body = json.dumps({
-            "taskType": "OUTPAINTING",
-            "outPaintingParams": {
-                "text": prompt,
-                "negativeText": negative_prompt,
-                "image": input_image,
-                "maskImage": input_mask_image,
-                "outPaintingMode": outpainting_mode
-            },
-            "imageGenerationConfig": {
-                "numberOfImages": 1,
-                "height": height,
-                "width": width,
-                "cfgScale": cfg_scale
-            }
-        })
+        body = BODY_TEMPLATE % (
+            orjson.dumps(prompt),
+            orjson.dumps(negative_prompt),
+            input_image,
+            input_mask_image,
+            orjson.dumps(outpainting_mode),
+            height,
+            width,
+            orjson.dumps(cfg_scale),
+        )
 
         # Generate image
-        image_bytes = generate_image(body)
+        image_bytes = await generate_image(body)
 
         # Save image
-        image_info = save_image(image_bytes, output_path=output_path)
+        image_info = save_image(image_bytes, prefix="outpainting", output_path=output_path)
 
         # Generate result
         result = {
@@ -81,6 +87,9 @@ async def outpainting(
         return result
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while outpainting: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while outpainting: {str(e)}"
+        ))
@@ -1,14 +1,25 @@
 import io
 
-import requests
+import httpx
 from PIL import Image as PILImage
 from mcp import McpError
 from mcp.server.fastmcp import Image
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from src.exceptions import ImageError
 
+# Largest image show_image will download from a URL
+MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024
 
-def show_image(image_path: str, width: int = 500, height: int = 500) -> Image:
+# Shared client so repeated downloads reuse pooled keep-alive connections
+HTTP_CLIENT = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    timeout=30,
+    follow_redirects=True
+)
+
+
+def show_image(image_path: str, width: int = 500, height: int = 500, image_format: str = "png") -> Image:
     """
     Create a thumbnail of the image and return it. The maximum size is 1048578.
     Supports URLs or local file paths.
@@ -17,20 +28,36 @@ def show_image(image_path: str, width: int = 500, height: int = 500) -> Image:
         image_path: Image URL or local file path
         width: Output image width (pixels)
         height: Output image height (pixels)
+        image_format: Thumbnail format (png or jpeg). jpeg encodes much faster.
         
     Returns:
         Image: Thumbnail image
     """
     try:
+        # Validate thumbnail format
+        if image_format not in ["png", "jpeg"]:
+            raise ImageError("image_format must be 'png' or 'jpeg'.")
+
         # Check if image_path is a URL or local file path
         if image_path.startswith('http://') or image_path.startswith('https://'):
-            # Download image from URL
-            response = requests.get(image_path, stream=True)
-            if response.status_code != 200:
-                raise ImageError(f"Failed to download image: {response.status_code}")
+            # Download image from URL, refusing anything over the size limit
+            with HTTP_CLIENT.stream("GET", image_path) as response:
+                if response.status_code != 200:
+                    raise ImageError(f"Failed to download image: {response.status_code}")
+
+                if int(response.headers.get('Content-Length') or 0) > MAX_DOWNLOAD_BYTES:
+                    raise ImageError(f"Image exceeds the maximum download size of {MAX_DOWNLOAD_BYTES} bytes.")
+
+                chunks = []
+                size = 0
+                for chunk in response.iter_bytes():
+                    size += len(chunk)
+                    if size > MAX_DOWNLOAD_BYTES:
+                        raise ImageError(f"Image exceeds the maximum download size of {MAX_DOWNLOAD_BYTES} bytes.")
+                    chunks.append(chunk)
 
             # Create image object
-            img = PILImage.open(io.BytesIO(response.content))
+            img = PILImage.open(io.BytesIO(b"".join(chunks)))
         else:
             # Read local file
             try:
@@ -38,21 +65,33 @@ def show_image(image_path: str, width: int = 500, height: int = 500) -> Image:
             except FileNotFoundError:
                 raise ImageError(f"Image file not found: {image_path}")
 
-        # Create thumbnail
-        img.thumbnail((width, height))
+        # Close the source image (and its file) as soon as the thumbnail is encoded
+        with img:
+            # Create thumbnail. thumbnail() already calls draft() with its default
+            # reducing_gap, so JPEGs are decoded at a reduced scale.
+            img.thumbnail((width, height))
 
-        # Convert RGBA image to RGB (if necessary)
-        if img.mode == 'RGBA':
-            img = img.convert('RGB')
+            # Convert RGBA image to RGB (if necessary)
+            if img.mode == 'RGBA':
+                img = img.convert('RGB')
 
-        # Convert image to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
+            # Convert image to bytes
+            img_bytes = io.BytesIO()
+            if image_format == "jpeg":
+                if img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+                img.save(img_bytes, format='JPEG', quality=85, optimize=False)
+            else:
+                img.save(img_bytes, format='PNG')
 
-        # Return image object
-        return Image(data=img_bytes.getvalue(), format="png")
+            # Return image object. getvalue() hands over the BytesIO buffer
+            # without copying it, as nothing else holds a view on it.
+            return Image(data=img_bytes.getvalue(), format=image_format)
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while displaying image: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while displaying image: {str(e)}"
+        ))
@@ -1,11 +1,20 @@
-import json
 from typing import Dict, Any
 
+import orjson
 from mcp import McpError
+from mcp.types import ErrorData, INVALID_PARAMS, INTERNAL_ERROR
 
 from ..exceptions import ImageError
 from ..utils.bedrock import generate_image
 from ..utils.image_storage import save_image
+from ..utils.validation import validate_image_config
+
+# Pre-serialized request body; only the variable fields are spliced in
+BODY_TEMPLATE = (
+    b'{"taskType":"TEXT_IMAGE",'
+    b'"textToImageParams":{"text":%s,"negativeText":%s},'
+    b'"imageGenerationConfig":{"numberOfImages":%d,"height":%d,"width":%d,"cfgScale":%s,"seed":%d}}'
+)
 
 
 async def text_to_image(
@@ -25,10 +34,10 @@ async def text_to_image(
     Args:
         prompt: Text prompt for generating an image (maximum 1024 characters)
         negative_prompt: Text prompt for excluding attributes from generation (maximum 1024 characters)
-        height: Image height (pixels)
-        width: Image width (pixels)
+        height: Image height (320-4096 pixels, multiple of 16)
+        width: Image width (320-4096 pixels, multiple of 16)
         num_images: Number of images to generate (maximum 4)
-        cfg_scale: Image matching degree for the prompt (1-20)
+        cfg_scale: Image matching degree for the prompt (1.1-10)
         seed: Seed value for image generation
         open_browser: Whether to open the image in the browser after generation
         output_path: Absolute path to save the image
@@ -37,6 +46,9 @@ async def text_to_image(
         Dict: Dictionary containing the file path of the generated image and the thumbnail image
     """
     try:
+        # Validate image generation settings
+        validate_image_config(height, width, cfg_scale)
+
         # Validate prompt length
         if len(prompt) > 1024:
             raise ImageError("Prompt cannot exceed 1024 characters.")
@@ -46,26 +58,21 @@ async def text_to_image(
         if num_images < 1 or num_images > 4:
             raise ImageError("num_images must be between 1 and 4.")
 
-        body = json.dumps({
-            "taskType": "TEXT_IMAGE",
-            "textToImageParams": {
-                "text": prompt,
-                "negativeText": negative_prompt
-            },
-            "imageGenerationConfig": {
-                "numberOfImages": num_images,
-                "height": height,
-                "width": width,
-                "cfgScale": cfg_scale,
-                "seed": seed
-            }
-        })
+        body = BODY_TEMPLATE % (
+            orjson.dumps(prompt),
+            orjson.dumps(negative_prompt),
+            num_images,
+            height,
+            width,
+            orjson.dumps(cfg_scale),
+            seed,
+        )
 
         # Generate image
-        image_bytes = generate_image(body)
+        image_bytes = await generate_image(body)
 
         # Save image
-        image_info = save_image(image_bytes, open_browser=open_browser, output_path=output_path)
+        image_info = save_image(image_bytes, prefix="text_to_image", open_browser=open_browser, output_path=output_path)
 
         # Generate result
         result = {
@@ -76,6 +83,9 @@ async def text_to_image(
         return result
 
     except ImageError as e:
-        raise McpError(str(e.message))
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=e.message))
     except Exception as e:
-        raise McpError(f"Error occurred while generating image: {str(e)}")
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Error occurred while generating image: {str(e)}"
+        ))
@@ -1,8 +1,11 @@
-import json
+import asyncio
 import logging
-import base64
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+import orjson
+import pybase64
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from config import get_app_config
@@ -16,23 +19,62 @@ conf = get_app_config()
 
 MODEL_ID = conf['model_id']
 
+# Maximum number of concurrent Bedrock requests
+MAX_CONCURRENT_REQUESTS = 64
+
+# Keep a large pool of keep-alive connections so concurrent requests reuse
+# TCP/TLS sessions, and allow for slow image generations
+client_config = Config(
+    max_pool_connections=MAX_CONCURRENT_REQUESTS,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=120
+)
+
 # Create Bedrock client using environment variables for AWS credentials
 client = boto3.client(
     service_name='bedrock-runtime',
-    region_name=conf['region']
+    region_name=conf['region'],
+    config=client_config
 )
 
-def generate_image(body):
+# Dedicated workers for the blocking Bedrock calls, one per pooled connection,
+# so concurrency is not capped by the size of the default executor
+BEDROCK_POOL = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="bedrock")
+
+# Prefix of the first base64 image in a compact Nova Canvas response body
+IMAGES_PREFIX = b'"images":["'
+
+
+async def generate_image(body):
     """
     Use Amazon Nova Canvas model to generate an image.
     
+    The blocking boto3 call runs on the Bedrock thread pool so that the event
+    loop keeps serving other tool calls while Bedrock is generating.
+    
+    Args:
+        body (bytes): JSON request body
+        
+    Returns:
+        bytes: Image generated by the model
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(BEDROCK_POOL, _invoke_model, body)
+
+
+def _invoke_model(body):
+    """
+    Invoke the Amazon Nova Canvas model synchronously.
+    
     Args:
-        body (str): Request body
+        body (bytes): JSON request body
         
     Returns:
         bytes: Image generated by the model
     """
-    logger.info(f"Generating image with Amazon Nova Canvas model {MODEL_ID}")
+    logger.info("Generating image with Amazon Nova Canvas model %s", MODEL_ID)
 
     accept = "application/json"
     content_type = "application/json"
@@ -42,19 +84,50 @@ def generate_image(body):
             body=body, modelId=MODEL_ID, accept=accept, contentType=content_type
         )
         
-        response_body = json.loads(response.get("body").read())
-        base64_image = response_body.get("images")[0]
-        base64_bytes = base64_image.encode('ascii')
-        image_bytes = base64.b64decode(base64_bytes)
+        response_body, base64_image = _parse_response(response.get("body").read())
 
         finish_reason = response_body.get("error")
         if finish_reason is not None:
             raise ImageError(f"Image generation error. Error: {finish_reason}")
 
-        logger.info(f"Successfully generated image with Amazon Nova Canvas model {MODEL_ID}")
+        if base64_image is None:
+            raise ImageError("Image generation error. Error: no image returned")
+
+        image_bytes = pybase64.b64decode(base64_image, validate=True)
+
+        logger.info("Successfully generated image with Amazon Nova Canvas model %s", MODEL_ID)
         return image_bytes
         
     except ClientError as err:
         message = err.response["Error"]["Message"]
-        logger.error(f"Client error occurred: {message}")
-        raise ImageError(f"Client error occurred: {message}") 
\ No newline at end of file
+        logger.error("Client error occurred: %s", message)
+        raise ImageError(f"Client error occurred: {message}")
+
+
+def _parse_response(raw):
+    """
+    Parse a model response body and pick out the first generated image.
+    
+    The base64 image is sliced straight out of the raw bytes, and only the
+    remaining few bytes of JSON are parsed. Falls back to parsing the whole
+    body if the response is not laid out as expected.
+    
+    Args:
+        raw (bytes): Response body
+        
+    Returns:
+        tuple: Parsed response body (without the first image) and the first
+            base64 encoded image, or None if the response contains no image
+    """
+    start = raw.find(IMAGES_PREFIX)
+    if start != -1:
+        start += len(IMAGES_PREFIX)
+        end = raw.find(b'"', start)
+        # Escaped characters inside the string need a real JSON parser
+        if end != -1 and raw.find(b"\\", start, end) == -1:
+            response_body = orjson.loads(raw[:start] + raw[end:])
+            return response_body, memoryview(raw)[start:end]
+
+    response_body = orjson.loads(raw)
+    images = response_body.get("images")
+    return response_body, images[0] if images else None
@@ -1,9 +1,21 @@
+import os
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import pybase64
 from mcp import McpError
+from mcp.types import ErrorData, INTERNAL_ERROR
 
 # Set logging
 logger = logging.getLogger(__name__)
 
+# Dedicated workers for reading and encoding input images (up to 5 per request),
+# kept apart from the Bedrock pool so encodes never queue behind slow generations
+ENCODE_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="image-encode")
+
 async def get_image(image_id: str) -> bytes:
     """
     Get an image by image ID.
@@ -16,8 +28,103 @@ async def get_image(image_id: str) -> bytes:
     """
     try:
         # Here, we assume image_id is a file path.
-        with open(image_id, "rb") as f:
-            return f.read()
+        return await asyncio.to_thread(Path(image_id).read_bytes)
     except Exception as e:
-        logger.error(f"Image load error: {e}")
-        raise McpError(f"Unable to load image: {str(e)}") 
\ No newline at end of file
+        logger.error("Image load error: %s", e)
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"Unable to load image: {str(e)}"
+        ))
+
+
+async def encode_image_file(image_path: str) -> bytes:
+    """
+    Read an image file and encode it to base64 on the encode thread pool.
+    
+    Each job reads and encodes one file in a single hop, so the images of a
+    multi-image request are processed in parallel.
+    
+    Args:
+        image_path: File path of the image
+        
+    Returns:
+        bytes: Base64 encoded image data
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(ENCODE_POOL, _encode_image_file, image_path)
+
+
+class _FileChangedError(Exception):
+    """Raised when an image file changes between stat and read"""
+
+
+def _encode_image_file(image_path: str) -> bytes:
+    """
+    Read an image file and encode it to base64, reusing a cached encoding
+    while the file is unchanged.
+    
+    Args:
+        image_path: File path of the image
+        
+    Returns:
+        bytes: Base64 encoded image data
+    """
+    # Key on the absolute path so a cwd change cannot hit a stale entry
+    image_path = os.path.abspath(image_path)
+    stat = os.stat(image_path)
+    try:
+        return _encode_image_file_cached(image_path, stat.st_mtime_ns, stat.st_size)
+    except _FileChangedError:
+        # The file changed while it was read; use the new content uncached
+        return _read_and_encode(image_path)[0]
+
+
+@lru_cache(maxsize=32)
+def _encode_image_file_cached(image_path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read an image file and encode it to base64, caching the result under the
+    file's modification time and size.
+    
+    Args:
+        image_path: Absolute file path of the image
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+        
+    Returns:
+        bytes: Base64 encoded image data
+        
+    Raises:
+        _FileChangedError: If the file read no longer matches the cache key
+    """
+    encoded, stat = _read_and_encode(image_path)
+    # Exceptions are not cached, so changed content never lands under the old key
+    if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+        raise _FileChangedError(image_path)
+    return encoded
+
+
+def _read_and_encode(image_path: str) -> tuple:
+    """
+    Read an image file and encode it to base64.
+    
+    The file is read into a buffer preallocated from its size, so no
+    intermediate bytes object is created before encoding.
+    
+    Args:
+        image_path: File path of the image
+        
+    Returns:
+        tuple: Base64 encoded image data and the stat result of the open file
+    """
+    # Unbuffered read straight into the preallocated buffer
+    with open(image_path, "rb", buffering=0) as f:
+        stat = os.fstat(f.fileno())
+        buffer = memoryview(bytearray(stat.st_size))
+        offset = 0
+        while offset < stat.st_size:
+            n = f.readinto(buffer[offset:])
+            if not n:
+                break
+            offset += n
+
+    return pybase64.b64encode(buffer[:offset]), stat
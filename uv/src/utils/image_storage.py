@@ -1,21 +1,37 @@
 import os
-import base64
 import logging
+import itertools
 import webbrowser
 from datetime import datetime
 from pathlib import Path
 
+import pybase64
+
 # Set logging
 logger = logging.getLogger(__name__)
 
-def save_image(image_bytes: bytes, open_browser: bool = True, output_path: str = None) -> dict:
+# Server start time and a per-process counter keep default file names unique
+# and in creation order without formatting a timestamp on every save
+RUN_ID = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+SEQUENCE = itertools.count(1)
+
+def save_image(
+        image_bytes: bytes,
+        prefix: str = "image",
+        open_browser: bool = True,
+        output_path: str = None,
+        return_base64: bool = False,
+) -> dict:
     """
     Save image to specified directory.
     
     Args:
         image_bytes (bytes): Image byte data
+        prefix (str): File name prefix for images saved to the default location
         open_browser (bool): Whether to open image in browser
         output_path (str): Optional specific path to save the image
+        return_base64 (bool): Whether to include the base64 encoded image in the result.
+            Callers that need it later can load it from image_path instead.
         
     Returns:
         Dict: Image file path and data information
@@ -29,20 +45,21 @@ def save_image(image_bytes: bytes, open_browser: bool = True, output_path: str =
         default_dir = os.path.join(str(Path.home()), '.aws-nova-canvas', 'images')
         os.makedirs(default_dir, exist_ok=True)
         
-        # Create unique file name using timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"image_{timestamp}.png"
+        # Create unique file name using the run ID and a sequence number
+        filename = f"{prefix}_{RUN_ID}_{next(SEQUENCE):04d}.png"
         filepath = os.path.join(default_dir, filename)
     
-    # Save image to file
-    with open(filepath, "wb") as f:
-        f.write(image_bytes)
+    # Save image to file, writing the buffer directly without a BufferedWriter
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(image_bytes)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     
     # Log file path
-    logger.info(f"Image saved: {filepath}")
-    
-    # Encode generated image to base64
-    image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+    logger.info("Image saved: %s", filepath)
     
     # Open image in browser
     if open_browser:
@@ -50,10 +67,15 @@ def save_image(image_bytes: bytes, open_browser: bool = True, output_path: str =
             webbrowser.open(f"file://{filepath}")
             logger.info("Opened image in browser")
         except Exception as e:
-            logger.warning(f"Failed to open image in browser: {e}")
+            logger.warning("Failed to open image in browser: %s", e)
     
-    return {
+    result = {
         "image_path": filepath,
-        "image_base64": image_base64,
         "filename": os.path.basename(filepath)
-    } 
\ No newline at end of file
+    }
+
+    # Encode generated image to base64 only when the caller asks for it
+    if return_base64:
+        result["image_base64"] = pybase64.b64encode(image_bytes).decode('ascii')
+
+    return result 
\ No newline at end of file
@@ -0,0 +1,43 @@
+from src.exceptions import ImageError
+
+# Output image limits of Amazon Nova Canvas
+MIN_IMAGE_SIZE = 320
+MAX_IMAGE_SIZE = 4096
+IMAGE_SIZE_STEP = 16
+MAX_PIXEL_COUNT = 4194304
+MIN_ASPECT_RATIO = 1 / 4
+MAX_ASPECT_RATIO = 4
+
+# cfgScale range accepted by Amazon Nova Canvas
+MIN_CFG_SCALE = 1.1
+MAX_CFG_SCALE = 10.0
+
+
+def validate_image_config(height: int, width: int, cfg_scale: float) -> None:
+    """
+    Validate image generation settings before any image data is read.
+    
+    Args:
+        height: Output image height (pixels)
+        width: Output image width (pixels)
+        cfg_scale: Prompt matching degree (1.1-10)
+        
+    Raises:
+        ImageError: If a setting is outside the range supported by the model
+    """
+    for name, value in (("height", height), ("width", width)):
+        if not MIN_IMAGE_SIZE <= value <= MAX_IMAGE_SIZE or value % IMAGE_SIZE_STEP != 0:
+            raise ImageError(
+                f"{name} must be between {MIN_IMAGE_SIZE} and {MAX_IMAGE_SIZE} "
+                f"and a multiple of {IMAGE_SIZE_STEP}."
+            )
+
+    if height * width >= MAX_PIXEL_COUNT:
+        raise ImageError(f"height x width must be less than {MAX_PIXEL_COUNT:,} pixels.")
+
+    if not MIN_ASPECT_RATIO <= width / height <= MAX_ASPECT_RATIO:
+        raise ImageError("Aspect ratio (width:height) must be between 1:4 and 4:1.")
+
+    # Chained comparison so that NaN is rejected too
+    if not MIN_CFG_SCALE <= cfg_scale <= MAX_CFG_SCALE:
+        raise ImageError(f"cfg_scale must be between {MIN_CFG_SCALE} and {MAX_CFG_SCALE}.")
@@ -0,0 +1,6 @@
+import os
+
+# Dummy credentials so the Bedrock client can be created without an AWS account
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_REGION", "us-east-1")
@@ -0,0 +1,69 @@
+import io
+
+import pybase64
+import pytest
+
+from src.exceptions import ImageError
+from src.utils import bedrock
+from src.utils.bedrock import _invoke_model, _parse_response
+
+
+def test_parse_response_slices_compact_body():
+    response_body, image = _parse_response(b'{"images":["QUJD","REVG"],"error":null}')
+
+    assert bytes(image) == b"QUJD"
+    assert response_body == {"images": ["", "REVG"], "error": None}
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (b'{"images": ["QUJD"], "error": null}', "QUJD"),
+    (b'{"images":["QU\\/D"]}', "QU/D"),
+])
+def test_parse_response_falls_back_to_full_parse(raw, expected):
+    response_body, image = _parse_response(raw)
+
+    assert image == expected
+    assert response_body["images"] == [expected]
+
+
+@pytest.mark.parametrize("raw", [
+    b'{"images":[],"error":"blocked"}',
+    b'{"error":"blocked"}',
+    b'{"images":[]}',
+])
+def test_parse_response_without_image(raw):
+    _, image = _parse_response(raw)
+
+    assert image is None
+
+
+def _stub_response(monkeypatch, raw):
+    monkeypatch.setattr(bedrock.client, "invoke_model", lambda **kwargs: {"body": io.BytesIO(raw)})
+
+
+def test_invoke_model_decodes_image(monkeypatch):
+    _stub_response(monkeypatch, b'{"images":["' + pybase64.b64encode(b"png") + b'"],"error":null}')
+
+    assert _invoke_model(b"{}") == b"png"
+
+
+@pytest.mark.parametrize("raw", [
+    b'{"images":[],"error":"blocked by content filter"}',
+    b'{"error":"blocked by content filter"}',
+])
+def test_invoke_model_reports_model_error(monkeypatch, raw):
+    _stub_response(monkeypatch, raw)
+
+    with pytest.raises(ImageError) as exc_info:
+        _invoke_model(b"{}")
+
+    assert "blocked by content filter" in exc_info.value.message
+
+
+def test_invoke_model_without_image(monkeypatch):
+    _stub_response(monkeypatch, b'{"images":[],"error":null}')
+
+    with pytest.raises(ImageError) as exc_info:
+        _invoke_model(b"{}")
+
+    assert "no image returned" in exc_info.value.message
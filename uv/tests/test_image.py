@@ -0,0 +1,63 @@
+import os
+from types import SimpleNamespace
+
+import pybase64
+
+from src.utils import image
+from src.utils.image import _encode_image_file
+
+
+def test_encode_image_file(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"\x89PNG data")
+
+    assert pybase64.b64decode(_encode_image_file(str(path))) == b"\x89PNG data"
+
+
+def test_encode_image_file_reencodes_changed_file(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"first")
+    assert pybase64.b64decode(_encode_image_file(str(path))) == b"first"
+
+    path.write_bytes(b"second version")
+    assert pybase64.b64decode(_encode_image_file(str(path))) == b"second version"
+
+
+def test_encode_image_file_keys_on_absolute_path(tmp_path, monkeypatch):
+    for name, content in (("a", b"image a"), ("b", b"image b")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "image.png").write_bytes(content)
+        # Same size and mtime, so only the directory tells them apart
+        os.utime(tmp_path / name / "image.png", ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert pybase64.b64decode(_encode_image_file("image.png")) == b"image a"
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert pybase64.b64decode(_encode_image_file("image.png")) == b"image b"
+
+
+def test_encode_image_file_skips_cache_when_file_changes_during_read(tmp_path, monkeypatch):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"newer content")
+
+    # Simulate a write landing between the stat and the read: the first read
+    # reports an fstat that no longer matches the cache key
+    real_read_and_encode = image._read_and_encode
+    calls = []
+
+    def read_and_encode(image_path):
+        encoded, stat = real_read_and_encode(image_path)
+        calls.append(image_path)
+        if len(calls) == 1:
+            stat = SimpleNamespace(st_mtime_ns=stat.st_mtime_ns + 1, st_size=stat.st_size)
+        return encoded, stat
+
+    monkeypatch.setattr(image, "_read_and_encode", read_and_encode)
+    cached = image._encode_image_file_cached.cache_info().currsize
+
+    assert pybase64.b64decode(_encode_image_file(str(path))) == b"newer content"
+    assert image._encode_image_file_cached.cache_info().currsize == cached
+
+    assert pybase64.b64decode(_encode_image_file(str(path))) == b"newer content"
+    assert image._encode_image_file_cached.cache_info().currsize == cached + 1
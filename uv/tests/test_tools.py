@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+from mcp import McpError
+from mcp.types import INVALID_PARAMS
+
+from src.tools.color_guided_generation import color_guided_generation
+from src.tools.text_to_image import text_to_image
+
+
+def test_invalid_color_message_reaches_caller():
+    with pytest.raises(McpError) as exc_info:
+        asyncio.run(color_guided_generation("a cat", ["#zzzzzz"]))
+
+    assert exc_info.value.error.code == INVALID_PARAMS
+    assert "Invalid color code: #zzzzzz" in exc_info.value.error.message
+
+
+def test_invalid_cfg_scale_message_reaches_caller():
+    with pytest.raises(McpError) as exc_info:
+        asyncio.run(text_to_image("a cat", cfg_scale=15))
+
+    assert exc_info.value.error.code == INVALID_PARAMS
+    assert "cfg_scale must be between" in exc_info.value.error.message
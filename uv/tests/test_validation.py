@@ -0,0 +1,32 @@
+import pytest
+
+from src.exceptions import ImageError
+from src.utils.validation import validate_image_config
+
+
+@pytest.mark.parametrize("height, width, cfg_scale", [
+    (512, 512, 8.0),
+    (1024, 1024, 1.1),
+    (320, 1280, 10),
+    (2048, 2032, 6.5),
+])
+def test_accepts_supported_settings(height, width, cfg_scale):
+    validate_image_config(height, width, cfg_scale)
+
+
+@pytest.mark.parametrize("height, width, cfg_scale, message", [
+    (304, 512, 8.0, "height must be between"),
+    (512, 4112, 8.0, "width must be between"),
+    (520, 512, 8.0, "multiple of 16"),
+    (2048, 2048, 8.0, "less than 4,194,304"),
+    (4096, 4096, 8.0, "less than 4,194,304"),
+    (320, 1296, 8.0, "Aspect ratio"),
+    (512, 512, 1.0, "cfg_scale"),
+    (512, 512, 15, "cfg_scale"),
+    (512, 512, float("nan"), "cfg_scale"),
+])
+def test_rejects_unsupported_settings(height, width, cfg_scale, message):
+    with pytest.raises(ImageError) as exc_info:
+        validate_image_config(height, width, cfg_scale)
+
+    assert message in exc_info.value.message